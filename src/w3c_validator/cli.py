@@ -1,19 +1,43 @@
 from __future__ import annotations
 
 import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional faster JSON parser, installed with the `fast` extra
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 W3C_NU_ENDPOINT = "https://validator.w3.org/nu/"
 
+# Upper bound on concurrent validator requests; the public W3C service
+# rate-limits clients that open too many at once.
+MAX_JOBS = 16
 
-@dataclass
+# Message "type" values in the Nu JSON output. Anything else is counted as info.
+ERROR_TYPE = "error"
+NON_DOCUMENT_ERROR_TYPE = "non-document-error"
+INFO_TYPE = "info"
+
+# Per-error report line template, bound once rather than rebuilt for every message
+_REPORT_ERROR_LINE = "- ERROR{location}: {text}\n".format
+
+
+@dataclass(slots=True, frozen=True)
 class MessageCounts:
     """Lightweight dataclass, with dunders generated automatically
     through the use of `@dataclass`.
+    Slotted and frozen: no per-instance `__dict__`, and safe to share or hash.
     Holds the number of each type of message from a single URL run.
     """
 
@@ -22,13 +46,70 @@ class MessageCounts:
     non_document_errors: int
 
 
+# Shared result for pages with no messages at all; safe to reuse as it's frozen
+_NO_MESSAGES = MessageCounts(errors=0, infos=0, non_document_errors=0)
+
+
 @dataclass
 class ValidationResult:
-    """Hold the complete validation result from a single URL run."""
+    """Hold the complete validation result from a single URL run.
+    Only the error messages are kept; other message types are just counted.
+    """
 
     url: str
     counts: MessageCounts
-    messages: list[dict[str, Any]]
+    errors: list[dict[str, Any]]
+
+
+def create_session(*, pool_size: int = MAX_JOBS) -> requests.Session:
+    """Build a session for talking to the validator (and, with --upload, the
+    pages themselves).
+    urllib3 keeps up to `pool_size` connections per host alive between URLs,
+    instead of repeating the TCP + TLS handshake for each one.
+    Gateway error responses (502/503/504) are retried twice with a short backoff;
+    timeouts and connection errors are not, so `--timeout` bounds each request.
+
+    Args:
+        pool_size (int): Connections kept alive per host; match the number of workers
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": "w3c-nu-validator-client/1.0",
+            "Accept": "application/json",
+        }
+    )
+
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=2,
+            # Only retry on status; a hung or unreachable server fails after
+            # one timeout instead of several
+            connect=False,
+            read=False,
+            other=False,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            # Keep the short backoff rather than sleeping as long as the server asks
+            respect_retry_after_header=False,
+            # Uploads are safe to repeat; the validator keeps no state
+            allowed_methods=frozenset({"GET", "POST"}),
+            # Hand the final response back so raise_for_status() reports it
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+# Shared default session for callers that don't pass their own
+_SESSION = create_session()
 
 
 def read_from_file(file_path: str) -> list[str]:
@@ -68,57 +149,184 @@ def read_from_file(file_path: str) -> list[str]:
     return urls
 
 
+def normalise_url(url: str) -> str:
+    """Normalise a URL so that equivalent spellings compare equal.
+
+    Rules:
+    - scheme and host are lower-cased (credentials are case-sensitive, so kept)
+    - an empty path becomes '/'
+    - the fragment is dropped (it is never sent to the server)
+
+    Args:
+        url (str): The URL as supplied by the user
+
+    Returns:
+        str: Normalised URL, used as a de-duplication key
+    """
+    parts = urlsplit(url.strip())
+
+    # Split off any "user:password@" so only the host (and port) is lower-cased
+    userinfo, at, host = parts.netloc.rpartition("@")
+
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            f"{userinfo}{at}{host.lower()}",
+            parts.path or "/",
+            parts.query,
+            "",
+        )
+    )
+
+
 def fetch_validation_json(
     document_url: str,
     *,
     timeout_seconds: int,
+    session: requests.Session | None = None,
 ) -> dict[str, Any]:
     """Make the single request for a single URL
 
     Args:
         document_url (str): The URL to validate
         timeout_seconds (int): Number of seconds allowed before timeout
+        session (requests.Session | None): Session to send the request with.
+            Defaults to the shared module level session.
 
     Returns:
         dict[str, Any]: Parsed JSON Response object
     """
-    response = requests.get(
+    if session is None:
+        session = _SESSION
+
+    response = session.get(
         W3C_NU_ENDPOINT,
         params={
             "doc": document_url,
             "out": "json",
         },
         timeout=timeout_seconds,
-        headers={
-            "User-Agent": "w3c-nu-validator-client/1.0",
-        },
     )
+    return parse_validation_response(response)
+
+
+def fetch_document(
+    document_url: str,
+    *,
+    timeout_seconds: int,
+    session: requests.Session | None = None,
+) -> tuple[bytes, str]:
+    """Download a page's markup locally, ready to upload to the validator.
+
+    Args:
+        document_url (str): The URL to download
+        timeout_seconds (int): Number of seconds allowed before timeout
+        session (requests.Session | None): Session to send the request with.
+            Defaults to the shared module level session.
+
+    Returns:
+        tuple[bytes, str]: Raw response body and its Content-Type
+        (defaults to UTF-8 HTML when the server doesn't send one).
+    """
+    if session is None:
+        session = _SESSION
+
+    response = session.get(
+        document_url,
+        timeout=timeout_seconds,
+        # Override the session's JSON Accept header
+        headers={"Accept": "text/html,application/xhtml+xml"},
+    )
+    response.raise_for_status()
+
+    content_type = response.headers.get("Content-Type", "text/html; charset=utf-8")
+
+    return response.content, content_type
+
+
+def post_validation_json(
+    markup: bytes,
+    *,
+    content_type: str,
+    timeout_seconds: int,
+    session: requests.Session | None = None,
+) -> dict[str, Any]:
+    """Upload markup to the validator, instead of having it fetch the URL itself
+
+    Args:
+        markup (bytes): The document body to validate
+        content_type (str): Content-Type the document was served with
+        timeout_seconds (int): Number of seconds allowed before timeout
+        session (requests.Session | None): Session to send the request with.
+            Defaults to the shared module level session.
+
+    Returns:
+        dict[str, Any]: Parsed JSON Response object
+    """
+    if session is None:
+        session = _SESSION
+
+    response = session.post(
+        W3C_NU_ENDPOINT,
+        params={"out": "json"},
+        data=markup,
+        headers={"Content-Type": content_type},
+        timeout=timeout_seconds,
+    )
+
+    return parse_validation_response(response)
+
+
+def parse_validation_response(response: requests.Response) -> dict[str, Any]:
+    """Check the validator's HTTP status and parse its JSON body
+
+    Args:
+        response (requests.Response): Response from the W3C_NU_ENDPOINT
+
+    Returns:
+        dict[str, Any]: Parsed JSON Response object
+    """
     response.raise_for_status()
+
+    if orjson is not None:
+        return orjson.loads(response.content)
+
     return response.json()
 
 
-def count_messages(payload: dict[str, Any]) -> MessageCounts:
-    messages = payload.get("messages", [])
+def summarise_messages(
+    messages: Iterable[dict[str, Any]],
+) -> tuple[MessageCounts, list[dict[str, Any]]]:
+    """Count every message type and collect the error messages in one pass,
+    so callers don't need to walk the message list a second time to find errors.
+    Only needs to iterate `messages` once, so any iterable of messages will do.
+
+    Args:
+        messages (Iterable[dict[str, Any]]): Messages from the parsed payload
 
-    error_count = 0
-    info_count = 0
+    Returns:
+        tuple[MessageCounts, list[dict[str, Any]]]: Message counts, and the
+        error messages in their original order.
+    """
+    errors: list[dict[str, Any]] = []
+    total = 0
     non_doc_count = 0
 
-    for m in messages:
-        m_type = m.get("type", "info")
-        if m_type == "error":
-            error_count += 1
-        elif m_type == "non-document-error":
+    for total, m in enumerate(messages, start=1):
+        m_type = m.get("type", INFO_TYPE)
+        if m_type == ERROR_TYPE:
+            errors.append(m)
+        elif m_type == NON_DOCUMENT_ERROR_TYPE:
             non_doc_count += 1
-        else:
-            info_count += 1
 
-    return MessageCounts(
-        errors=error_count,
-        infos=info_count,
+    counts = MessageCounts(
+        errors=len(errors),
+        infos=total - len(errors) - non_doc_count,
         non_document_errors=non_doc_count,
     )
 
+    return counts, errors
+
 
 def get_location(
     message: dict[str, Any],
@@ -129,7 +337,8 @@ def get_location(
     int | None,
 ]:
     """Access various error location points using keys in message dict.
-    Each access has fallback.
+    Each access falls back to the generic "line" / "column" key, but only when
+    the specific key is absent, so a legitimate 0 is kept.
 
     Tuple chosen as return as data is temporary, positional and immediately unpacked.
 
@@ -139,11 +348,15 @@ def get_location(
     Returns:
         tuple[ int | None, int | None, int | None, int | None, ]: Tuple containing all 4 location pooints.
     """
-    first_line = message.get("firstLine") or message.get("line")
-    last_line = message.get("lastLine") or message.get("line")
+    get = message.get
+    line = get("line")
+    column = get("column")
 
-    first_col = message.get("firstColumn") or message.get("column")
-    last_col = message.get("lastColumn") or message.get("column")
+    first_line = get("firstLine", line)
+    last_line = get("lastLine", line)
+
+    first_col = get("firstColumn", column)
+    last_col = get("lastColumn", column)
 
     return first_line, last_line, first_col, last_col
 
@@ -159,79 +372,42 @@ def collapse_blank_lines(text: str) -> str:
         str: HTML extract with empty blank lines collapsed
     """
 
-    lines = text.splitlines()
-
-    normalised_lines: list[str] = []
-
-    for line in lines:
-        is_blank = not line.strip()
-
-        if is_blank:
-            continue
-
-        normalised_lines.append(line.rstrip())
+    return "\n".join(line.rstrip() for line in text.splitlines() if line.strip())
 
-    return "\n".join(normalised_lines)
 
-
-def print_error_messages(payload: dict[str, Any]) -> None:
-    """Read and print any error messages from the parsed response JSON payload.
-    Downstream expects an iterable, so default from get() is empty list.
+def format_location(message: dict[str, Any]) -> str:
+    """Build the human readable location suffix for a message,
+    e.g. " (lines 3-5, columns 1-12)".
 
     Args:
-        payload (dict[str,Any]): Parsed JSON payload
-    """
-    # print(f"payload: ", payload)
-    messages = payload.get("messages", [])
-
-    # print(messages)
+        message (dict[str, Any]): Message from validation response
 
-    # Iterate over messages, skipping non error messages
-    for m in messages:
-        # print(f"Type: {m.get("type")}")
-        if m.get("type") != "error":
-            continue
+    Returns:
+        str: Location suffix with a leading space, or "" if the message has no location
+    """
+    first_line, last_line, first_col, last_col = get_location(message)
 
-        (
-            first_line,
-            last_line,
-            first_col,
-            last_col,
-        ) = get_location(m)
-
-        text = (m.get("message") or "").strip()
-
-        # Use blank lines helper
-        raw_extract = m.get("extract") or ""
-        extract = collapse_blank_lines(raw_extract).strip()
-        # extract = (m.get("extract") or "").strip()
-
-        line_column_coordinates: list[str] = []
-        if first_line is not None and last_line is not None:
-            if first_line == last_line:
-                line_column_coordinates.append(f"line {last_line}")
-            else:
-                line_column_coordinates.append(f"lines {first_line}-{last_line}")
-        elif last_line is not None:
+    line_column_coordinates: list[str] = []
+    if first_line is not None and last_line is not None:
+        if first_line == last_line:
             line_column_coordinates.append(f"line {last_line}")
+        else:
+            line_column_coordinates.append(f"lines {first_line}-{last_line}")
+    elif last_line is not None:
+        line_column_coordinates.append(f"line {last_line}")
 
-        if first_col is not None and last_col is not None:
-            if first_col == last_col:
-                line_column_coordinates.append(f"column: {last_col}")
-            else:
-                line_column_coordinates.append(f"columns {first_col}-{last_col}")
-        elif last_col is not None:
+    if first_col is not None and last_col is not None:
+        if first_col == last_col:
             line_column_coordinates.append(f"column: {last_col}")
+        else:
+            line_column_coordinates.append(f"columns {first_col}-{last_col}")
+    elif last_col is not None:
+        line_column_coordinates.append(f"column: {last_col}")
 
-        location = (
-            f" ({', '.join(line_column_coordinates)})"
-            if line_column_coordinates
-            else ""
-        )
-        print(f"    - ERROR{location}: {text}")
+    if not line_column_coordinates:
+        return ""
 
-        if extract:
-            print(f"      Extract:\n{extract}\n")
+    return f" ({', '.join(line_column_coordinates)})"
 
 
 def write_full_report(
@@ -257,50 +433,20 @@ def write_full_report(
             )
 
             # Write each individual message
-            for message in result.messages:
-                if message.get("type") != "error":
-                    continue
-
+            for message in result.errors:
                 # Use helpers to extract
-                first_line, last_line, first_col, last_col = get_location(message)
-                text = (message.get("message") or "").strip()
-                raw_extract = message.get("extract") or ""
-                extract = collapse_blank_lines(raw_extract).strip()
-
-                # Extract line-column co-ordinates
-                line_column_coordinates: list[str] = []
-                if first_line is not None and last_line is not None:
-                    if first_line == last_line:
-                        line_column_coordinates.append(f"line {last_line}")
-                    else:
-                        line_column_coordinates.append(
-                            f"lines {first_line}-{last_line}"
-                        )
-                elif last_line is not None:
-                    line_column_coordinates.append(f"line {last_line}")
-
-                if first_col is not None and last_col is not None:
-                    if first_col == last_col:
-                        line_column_coordinates.append(f"column: {last_col}")
-                    else:
-                        line_column_coordinates.append(
-                            f"columns {first_col}-{last_col}"
-                        )
-                elif last_col is not None:
-                    line_column_coordinates.append(f"column: {last_col}")
-
-                location = (
-                    f" ({', '.join(line_column_coordinates)})"
-                    if line_column_coordinates
-                    else ""
-                )
+                get = message.get
+                text = (get("message") or "").strip()
+                extract = collapse_blank_lines(get("extract") or "").strip()
 
-                fh.write(f"- ERROR{location}: {text}\n")
+                fh.write(
+                    _REPORT_ERROR_LINE(location=format_location(message), text=text)
+                )
 
                 if extract:
-                    fh.write(f"  Markup Extract:\n")
-                    for line in extract.splitlines():
-                        fh.write(f"    {line}\n")
+                    # Indent the whole extract in one join and write
+                    indented = "".join(f"    {line}\n" for line in extract.splitlines())
+                    fh.write(f"  Markup Extract:\n{indented}")
                 fh.write("\n")
 
             if result.counts.errors == 0:
@@ -309,25 +455,56 @@ def write_full_report(
         pass
 
 
-def validate_one(url: str, *, timeout_seconds: int) -> int:
+def validate_one(
+    url: str,
+    *,
+    timeout_seconds: int,
+    session: requests.Session | None = None,
+    upload: bool = False,
+) -> ValidationResult:
     """Validate a single deployed URL's markup
-    Calls the W3C_NU_ENDPOINT with a GET request to validate the markup at the `url`
+    Calls the W3C_NU_ENDPOINT with a GET request to validate the markup at the `url`,
+    or with `upload`, downloads the markup locally and POSTs it to the endpoint.
 
     Args:
         url (str): The deployed URL in question
+        timeout_seconds (int): Number of seconds allowed before timeout
+        session (requests.Session | None): Session to send the requests with.
+        upload (bool): Fetch the page locally and upload it to the validator
 
     Returns:
         ValidationResult: A complete validation result dataclass instance.
     """
 
-    payload = fetch_validation_json(url, timeout_seconds=timeout_seconds)
+    if upload:
+        markup, content_type = fetch_document(
+            url,
+            timeout_seconds=timeout_seconds,
+            session=session,
+        )
+        payload = post_validation_json(
+            markup,
+            content_type=content_type,
+            timeout_seconds=timeout_seconds,
+            session=session,
+        )
+    else:
+        payload = fetch_validation_json(
+            url,
+            timeout_seconds=timeout_seconds,
+            session=session,
+        )
     messages = payload.get("messages", [])
-    counts = count_messages(payload)
+
+    if messages:
+        counts, errors = summarise_messages(messages)
+    else:
+        counts, errors = _NO_MESSAGES, []
 
     return ValidationResult(
         url=url,
         counts=counts,
-        messages=messages,
+        errors=errors,
     )
 
 
@@ -356,6 +533,22 @@ def build_arg_parser() -> argparse.ArgumentParser:
         help="Request timeout in seconds (default: 30).",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=8,
+        help=f"Number of URLs to validate concurrently, 1-{MAX_JOBS} (default: 8).",
+    )
+
+    parser.add_argument(
+        "--upload",
+        "-u",
+        action="store_true",
+        help="Fetch each page locally and upload its markup to the validator, "
+        "instead of having the validator fetch the URL.",
+    )
+
     parser.add_argument(
         "--out",
         "-o",
@@ -399,35 +592,60 @@ def main() -> int:
 
     all_urls.extend(args.urls)
 
-    deduped_urls: list[str] = []
-    seen: set[str] = set()
+    # Key on the normalised URL so that each page only hits the validator once,
+    # keeping the first spelling seen for the console output and report.
+    unique_urls: dict[str, str] = {}
 
     for url in all_urls:
-        if url in seen:
-            continue
-        seen.add(url)
-        deduped_urls.append(url)
+        unique_urls.setdefault(normalise_url(url), url)
+
+    deduped_urls = list(unique_urls.values())
 
     if not deduped_urls:
         parser.error("No URLs provided. Pass URLs as arguments or use -r/--read-file")
 
+    if not 1 <= args.jobs <= MAX_JOBS:
+        parser.error(f"--jobs must be between 1 and {MAX_JOBS}")
+
     results: list[ValidationResult] = []
     exit_code = 0
 
-    for url in deduped_urls:
-        result = validate_one(url, timeout_seconds=args.timeout)
-        results.append(result)
-        if result.counts.errors:
-            exit_code = 1
-
-        # Still print summary to console
-        print(
-            f"{url}\n"
-            f"  Errors: {result.counts.errors} | "
-            f"Info/Warnings: {result.counts.infos} | "
-            f"Non-doc: {result.counts.non_document_errors}"
+    # Each validation is almost entirely spent waiting on the W3C endpoint,
+    # so overlap the requests in a thread pool.
+    # `map()` yields results in input order, keeping the console output stable.
+    # URLs are de-duplicated above, so there is never more than one request in
+    # flight for the same page.
+    # The session's pool is sized to the workers so every one keeps its
+    # connection warm rather than recycling it.
+    workers = min(args.jobs, len(deduped_urls))
+
+    with (
+        create_session(pool_size=workers) as session,
+        ThreadPoolExecutor(max_workers=workers) as pool,
+    ):
+        validated = pool.map(
+            lambda url: validate_one(
+                url,
+                timeout_seconds=args.timeout,
+                session=session,
+                upload=args.upload,
+            ),
+            deduped_urls,
         )
 
+        for result in validated:
+            results.append(result)
+            if result.counts.errors:
+                exit_code = 1
+
+            # Still print summary to console, as one write per URL
+            sys.stdout.write(
+                f"{result.url}\n"
+                f"  Errors: {result.counts.errors} | "
+                f"Info/Warnings: {result.counts.infos} | "
+                f"Non-doc: {result.counts.non_document_errors}\n"
+            )
+
     if args.out:
         write_full_report(results, output_path=args.out)
         print(f"\nFull validation report written to: {args.out}")